@@ -1,9 +1,10 @@
 from ._converter import ImmutableConverter
-from .json import Jsonable, JsonImmutableConverter, is_json_compatible_type
+from .json import Jsonable, JsonImmutableConverter, TryUnstructure, is_json_compatible_type
 
 __all__ = [
     "ImmutableConverter",
     "JsonImmutableConverter",
     "Jsonable",
+    "TryUnstructure",
     "is_json_compatible_type",
 ]
@@ -1,4 +1,3 @@
-import copy
 from collections.abc import Callable
 from typing import Any, Self, TypeGuard
 
@@ -97,6 +96,8 @@ class ImmutableConverter[C: Converter, R]:
         newer_converter = self._converter.copy()
         newer_converter.register_unstructure_hook(cls, hook)
 
-        newer = copy.copy(self)
-        newer._converter = newer_converter  # noqa: SLF001
+        # Bypass the subclass __init__, which may take different arguments
+        # (e.g. JsonImmutableConverter builds its own cattrs converter).
+        newer = object.__new__(type(self))
+        ImmutableConverter.__init__(newer, newer_converter, self._type_guard)
         return newer
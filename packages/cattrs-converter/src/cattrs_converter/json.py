@@ -2,8 +2,10 @@
 JSON conversion utilities using cattrs for flexible type handling.
 """
 
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from decimal import Decimal
-from typing import Any, TypeGuard
+from types import NoneType
+from typing import Any, Self, TypeGuard
 from uuid import UUID
 
 from cattrs.preconf.json import JsonConverter, make_converter
@@ -12,6 +14,17 @@ from ._converter import ImmutableConverter
 
 Jsonable = None | bool | int | float | str | list["Jsonable"] | dict[str, "Jsonable"]
 
+# isinstance targets for the type guard; tuples avoid building a union object on every check.
+_JSON_SCALAR_TYPES = (NoneType, bool, int, float, str)
+_JSON_CONTAINER_TYPES = (list, dict)
+# Exact-type membership is checked first: it is a single hash lookup, whereas isinstance
+# against a tuple tries each entry in turn. isinstance still covers subclasses.
+# The converter also passes these exact types through unchanged, so subclasses such as
+# enums still go through the registered hooks.
+_EXACT_JSON_SCALAR_TYPES: frozenset[type[Any]] = frozenset(_JSON_SCALAR_TYPES)
+
+TryUnstructure = Callable[[Any], tuple[Jsonable, bool]]
+
 
 class JsonImmutableConverter(ImmutableConverter[JsonConverter, Jsonable]):
     """
@@ -26,6 +39,10 @@ class JsonImmutableConverter(ImmutableConverter[JsonConverter, Jsonable]):
     - UUID: converted to string
     - datetime: converted to ISO format string (via cattrs default behavior)
 
+    Values that are already JSON scalars (None, str, int, float, bool) are returned
+    as-is without dispatching through cattrs, unless a hook has been registered for
+    their exact type via ``register_unstructure_hook``.
+
     Examples
     --------
     >>> converter = JsonImmutableConverter()
@@ -47,6 +64,66 @@ class JsonImmutableConverter(ImmutableConverter[JsonConverter, Jsonable]):
         converter.register_unstructure_hook(UUID, _convert_uuid_to_str)
 
         super().__init__(converter, is_json_compatible_type)
+        self._passthrough_types = _EXACT_JSON_SCALAR_TYPES
+
+    def register_unstructure_hook[T](
+        self,
+        cls: type[T],
+        hook: Callable[[T], Jsonable],
+    ) -> Self:
+        """
+        Register a custom unstructure hook for a specific type.
+
+        Creates a new converter with the additional hook registered. Registering a hook
+        for a JSON scalar type disables the pass-through fast path for that type.
+
+        Parameters
+        ----------
+        cls : type[T]
+            The type to register the hook for
+        hook : Callable[[T], Jsonable]
+            The function to use for unstructuring instances of cls
+
+        Returns
+        -------
+        Self
+            A new JsonImmutableConverter instance with the hook registered
+
+        Examples
+        --------
+        >>> converter = JsonImmutableConverter().register_unstructure_hook(str, str.upper)
+        >>> converter.unstructure("abc")
+        'ABC'
+        """
+        newer = super().register_unstructure_hook(cls, hook)
+        # cattrs applies the hook to subclasses of cls too, so they must leave the fast path
+        newer._passthrough_types = frozenset(  # noqa: SLF001
+            t for t in self._passthrough_types if not issubclass(t, cls)
+        )
+        return newer
+
+    def unstructure(self, value: Any) -> Jsonable:
+        """
+        Convert a value to its JSON-compatible representation.
+
+        Parameters
+        ----------
+        value : Any
+            The value to unstructure
+
+        Returns
+        -------
+        Jsonable
+            The unstructured value
+
+        Raises
+        ------
+        ValueError
+            If the unstructured value is not JSON-compatible
+        """
+        if type(value) in self._passthrough_types:
+            return value
+        return super().unstructure(value)
 
     def unstructure_safely(self, value: Any) -> Jsonable:
         """
@@ -88,10 +165,145 @@ class JsonImmutableConverter(ImmutableConverter[JsonConverter, Jsonable]):
         >>> converter.unstructure_safely(uuid.UUID('12345678-1234-5678-1234-567812345678'))
         '12345678-1234-5678-1234-567812345678'
         """
-        unstructured = self._converter.unstructure(value)
-        if self._type_guard(unstructured):
+        unstructured, ok = self.try_unstructure(value)
+        if ok:
             return unstructured
-        return f"<unsupported_type: {type(value).__name__}>"
+        return _unsupported_type_placeholder(type(value))
+
+    def try_unstructure(self, value: Any) -> tuple[Jsonable, bool]:
+        """
+        Convert a value to a JSON-compatible representation without raising.
+
+        Parameters
+        ----------
+        value : Any
+            The value to convert
+
+        Returns
+        -------
+        tuple[Jsonable, bool]
+            The unstructured value and True if it is JSON-compatible,
+            otherwise None and False (also when a hook raises ValueError)
+
+        Examples
+        --------
+        >>> converter = JsonImmutableConverter()
+        >>> converter.try_unstructure([1, 2, 3])
+        ([1, 2, 3], True)
+        >>> converter.try_unstructure(1 + 2j)
+        (None, False)
+        """
+        if type(value) in self._passthrough_types:
+            return value, True
+        try:
+            unstructured = self._converter.unstructure(value)
+        except ValueError:
+            return None, False
+        if self._type_guard(unstructured):
+            return unstructured, True
+        return None, False
+
+    def try_unstructure_fn(self, cls: type[Any]) -> TryUnstructure:
+        """
+        Resolve a ``try_unstructure`` function specialized for values of exactly type ``cls``.
+
+        Callers that convert many values of the same type (e.g. a result set column)
+        can resolve the function once and reuse it for every value.
+
+        Parameters
+        ----------
+        cls : type[Any]
+            The exact type of the values to convert
+
+        Returns
+        -------
+        TryUnstructure
+            A function behaving like ``try_unstructure`` for values of type ``cls``
+
+        Examples
+        --------
+        >>> converter = JsonImmutableConverter()
+        >>> converter.try_unstructure_fn(str)("hello")
+        ('hello', True)
+        >>> from decimal import Decimal
+        >>> converter.try_unstructure_fn(Decimal)(Decimal("1.5"))
+        (1.5, True)
+        """
+        if cls in self._passthrough_types:
+            return _passthrough
+
+        hook = self._converter.get_unstructure_hook(cls)
+        type_guard = self._type_guard
+
+        def try_unstructure(value: Any) -> tuple[Jsonable, bool]:
+            try:
+                unstructured = hook(value)
+            except ValueError:
+                return None, False
+            if type_guard(unstructured):
+                return unstructured, True
+            return None, False
+
+        return try_unstructure
+
+    def unstructure_batch(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+    ) -> tuple[list[dict[str, Jsonable]], list[str]]:
+        """
+        Convert rows of values to JSON-safe representations.
+
+        Rows coming from a database are homogeneous per key, so the cattrs hook for
+        each key is resolved once and reused until a value of another type shows up.
+        Values that cannot be converted are replaced the same way as in
+        ``unstructure_safely``.
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[str, Any]]
+            The rows to convert
+
+        Returns
+        -------
+        tuple[list[dict[str, Jsonable]], list[str]]
+            The converted rows, and the keys that held unsupported values
+            in first-seen order
+
+        Examples
+        --------
+        >>> from decimal import Decimal
+        >>> converter = JsonImmutableConverter()
+        >>> converter.unstructure_batch([{"a": Decimal("1.5"), "b": 1j}, {"a": None, "b": 2j}])
+        ([{'a': 1.5, 'b': '<unsupported_type: complex>'}, {'a': None, 'b': '<unsupported_type: complex>'}], ['b'])
+        """
+        resolved_fns: dict[str, tuple[type[Any], TryUnstructure]] = {}
+        unsupported_keys: dict[str, None] = {}
+        converted_rows: list[dict[str, Jsonable]] = []
+
+        for row in rows:
+            converted: dict[str, Jsonable] = {}
+            for key, value in row.items():
+                value_type = type(value)
+                resolved = resolved_fns.get(key)
+                if resolved is None or resolved[0] is not value_type:
+                    resolved = resolved_fns[key] = (value_type, self.try_unstructure_fn(value_type))
+                unstructured, ok = resolved[1](value)
+                if ok:
+                    converted[key] = unstructured
+                else:
+                    converted[key] = _unsupported_type_placeholder(value_type)
+                    unsupported_keys[key] = None
+            converted_rows.append(converted)
+
+        return converted_rows, list(unsupported_keys)
+
+
+def _passthrough(value: Any) -> tuple[Jsonable, bool]:
+    return value, True
+
+
+def _unsupported_type_placeholder(cls: type[Any]) -> str:
+    return f"<unsupported_type: {cls.__name__}>"
 
 
 def _convert_decimal_to_float(dec: Decimal) -> float:
@@ -173,18 +385,89 @@ def is_json_compatible_type(value: Any) -> TypeGuard[Jsonable]:
     True
     >>> is_json_compatible_type({1: "invalid_key"})
     False
+    >>> cyclic = [1]
+    >>> cyclic.append(cyclic)
+    >>> is_json_compatible_type(cyclic)
+    False
     >>> import datetime
     >>> is_json_compatible_type(datetime.datetime.now())
     False
     """
-    if value is None:
-        return True
-    if isinstance(value, bool | int | float | str):
+    if type(value) in _EXACT_JSON_SCALAR_TYPES or isinstance(value, _JSON_SCALAR_TYPES):
         return True
-    if isinstance(value, list):
-        return all(is_json_compatible_type(item) for item in value)
-    if isinstance(value, dict):
-        return all(isinstance(key, str) for key in value) and all(
-            is_json_compatible_type(val) for val in value.values()
-        )
-    return False
+    if not isinstance(value, _JSON_CONTAINER_TYPES):
+        return False
+
+    # Walk nested containers iteratively so deep trees cost neither a Python frame
+    # per level nor a recursion-limit failure. A container met twice is either shared
+    # or part of a reference cycle; only then is the slower path-tracking walk needed.
+    seen: set[int] = set()
+    stack: list[list[Any] | dict[Any, Any]] = [value]
+    while stack:
+        container = stack.pop()
+        container_id = id(container)
+        if container_id in seen:
+            return _is_acyclic_json_container(value)
+        seen.add(container_id)
+        children = _json_container_children(container)
+        if children is None:
+            return False
+        for item in children:
+            item_type = type(item)
+            if item_type in _EXACT_JSON_SCALAR_TYPES:
+                continue
+            if item_type is list or item_type is dict or isinstance(item, _JSON_CONTAINER_TYPES):
+                stack.append(item)
+                continue
+            if isinstance(item, _JSON_SCALAR_TYPES):
+                continue
+            return False
+    return True
+
+
+def _is_acyclic_json_container(value: list[Any] | dict[Any, Any]) -> bool:
+    """Check a JSON container depth-first, rejecting reference cycles.
+
+    ``on_path`` holds the containers currently being walked; meeting one of them again
+    means a cycle, which JSON cannot represent. Containers shared between siblings are
+    checked once per occurrence.
+    """
+    children = _json_container_children(value)
+    if children is None:
+        return False
+
+    on_path = {id(value)}
+    stack: list[tuple[int, Iterator[Any]]] = [(id(value), iter(children))]
+    while stack:
+        container_id, items = stack[-1]
+        for item in items:
+            item_type = type(item)
+            if item_type in _EXACT_JSON_SCALAR_TYPES:
+                continue
+            if item_type is list or item_type is dict or isinstance(item, _JSON_CONTAINER_TYPES):
+                item_id = id(item)
+                if item_id in on_path:
+                    return False
+                children = _json_container_children(item)
+                if children is None:
+                    return False
+                on_path.add(item_id)
+                stack.append((item_id, iter(children)))
+                break
+            if isinstance(item, _JSON_SCALAR_TYPES):
+                continue
+            return False
+        else:
+            on_path.discard(container_id)
+            _ = stack.pop()
+    return True
+
+
+def _json_container_children(container: list[Any] | dict[Any, Any]) -> Iterable[Any] | None:
+    """Return the values held by a JSON container, or None if a dict has a non-string key."""
+    if isinstance(container, dict):
+        for key in container:
+            if type(key) is not str and not isinstance(key, str):
+                return None
+        return container.values()
+    return container
@@ -1,10 +1,22 @@
 import inspect
 from collections.abc import Awaitable, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, NoReturn, ParamSpec
 
 P = ParamSpec("P")
 
+# Parameter names whose arguments are redacted from contract violation context
+_SENSITIVE_NAMES: frozenset[str] = frozenset({
+    "password",
+    "passwd",
+    "pwd",
+    "secret",
+    "token",
+    "key",
+    "api_key",
+    "auth",
+})
+
 
 class ContractViolationError(Exception):
     """Exception raised when a contract violation occurs.
@@ -124,30 +136,17 @@ def _sanitize_arguments(
     kwargs: dict[str, Any],
 ) -> dict[str, Any]:
     """Sanitize function arguments to remove sensitive information."""
-    # List of sensitive parameter names that should be redacted
-    sensitive_names = {
-        "password",
-        "passwd",
-        "pwd",
-        "secret",
-        "token",
-        "key",
-        "api_key",
-        "auth",
-    }
-
-    # Get function signature to map positional args to parameter names
+    # Get lowercased parameter names to map positional args to
     try:
-        sig = inspect.signature(fn)
-        param_names = list(sig.parameters.keys())
-    except (ValueError, TypeError):
-        # Fallback if signature inspection fails
-        param_names = []
+        param_names = _lower_param_names(fn)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        param_names = _lower_param_names.__wrapped__(fn)
 
     # Sanitize positional arguments
     sanitized_args = []
     for i, arg in enumerate(args):
-        if i < len(param_names) and param_names[i].lower() in sensitive_names:
+        if i < len(param_names) and param_names[i] in _SENSITIVE_NAMES:
             sanitized_args.append("<REDACTED>")
         else:
             sanitized_args.append(arg)
@@ -155,7 +154,7 @@ def _sanitize_arguments(
     # Sanitize keyword arguments
     sanitized_kwargs = {}
     for key, value in kwargs.items():
-        if key.lower() in sensitive_names:
+        if key.lower() in _SENSITIVE_NAMES:
             sanitized_kwargs[key] = "<REDACTED>"
         else:
             sanitized_kwargs[key] = value
@@ -163,6 +162,16 @@ def _sanitize_arguments(
     return {"args": tuple(sanitized_args), "kwargs": sanitized_kwargs}
 
 
+@lru_cache(maxsize=1024)
+def _lower_param_names(fn: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the lowercased parameter names of a function, cached per function."""
+    try:
+        return tuple(name.lower() for name in inspect.signature(fn).parameters)
+    except (ValueError, TypeError):
+        # Fallback if signature inspection fails
+        return ()
+
+
 def contract[R, **P](
     *,
     map_err: Callable[
@@ -241,6 +250,7 @@ def contract[R, **P](
                 raise
             except Exception as e:
                 map_err(e, fn, args, kwargs)
+                raise RuntimeError("map_err must not return") from e
 
         return wrapper
 
@@ -332,6 +342,7 @@ def contract_async[R, **P](
                 raise
             except Exception as e:
                 map_err(e, fn, args, kwargs)
+                raise RuntimeError("map_err must not return") from e
 
         return wrapper
 
@@ -12,7 +12,7 @@ import attrs
 from cattrs_converter import Jsonable, JsonImmutableConverter
 
 
-@attrs.define(frozen=True)
+@attrs.define(frozen=True, slots=True, eq=False)
 class RowProcessingResult:
     """Result of processing a single row of Snowflake data.
 
@@ -32,22 +32,11 @@ class RowProcessingResult:
 
     @classmethod
     def from_raw_row(cls, converter: JsonImmutableConverter, raw_row: dict[str, Any]) -> "RowProcessingResult":
-        processed_row: dict[str, Jsonable] = {}
-        warnings: list[str] = []
+        (processed_row,), unsupported_columns = converter.unstructure_batch([raw_row])
+        return cls(processed_row=processed_row, warnings=_to_warnings(unsupported_columns))
 
-        for column, value in raw_row.items():
-            try:
-                processed_value = converter.unstructure(value)
-            except ValueError:
-                processed_row[column] = f"<unsupported_type: {type(value).__name__}>"
-                warnings.append(f"Column '{column}' contains unsupported data type")
-            else:
-                processed_row[column] = processed_value
 
-        return cls(processed_row=processed_row, warnings=warnings)
-
-
-@attrs.define(frozen=True)
+@attrs.define(frozen=True, slots=True, eq=False)
 class DataProcessingResult:
     """Result of processing multiple rows of Snowflake data.
 
@@ -75,12 +64,9 @@ class DataProcessingResult:
         if not raw_rows:
             return cls(processed_rows=[], warnings=[])
 
-        processed_rows: list[dict[str, Jsonable]] = []
-        warnings_set: set[str] = set()
+        processed_rows, unsupported_columns = converter.unstructure_batch(raw_rows)
+        return cls(processed_rows=processed_rows, warnings=_to_warnings(unsupported_columns))
 
-        for row in raw_rows:
-            result = RowProcessingResult.from_raw_row(converter, row)
-            processed_rows.append(result.processed_row)
-            warnings_set.update(result.warnings)
 
-        return cls(processed_rows=processed_rows, warnings=list(warnings_set))
+def _to_warnings(unsupported_columns: list[str]) -> list[str]:
+    return [f"Column '{column}' contains unsupported data type" for column in unsupported_columns]
@@ -1,6 +1,7 @@
 """Data types for Snowflake domain layer."""
 
-from typing import Literal, Self, TypeGuard
+from functools import lru_cache
+from typing import Literal, TypeGuard
 
 import attrs
 
@@ -44,8 +45,9 @@ NormalizedSnowflakeDataType = Literal[
     # Structured data types (for Iceberg)
     "MAP",
 ]
+# A frozenset beats a linear scan of the ~30-member Literal tuple for membership tests
 NORMALIZED_SNOWFLAKE_DATA_TYPES: frozenset[str] = frozenset(NormalizedSnowflakeDataType.__args__)
-ALIAS_MAPPING = {
+ALIAS_MAPPING: dict[str, NormalizedSnowflakeDataType] = {
     "NUMERIC": "DECIMAL",
     "INTEGER": "INT",
     "DOUBLE PRECISION": "DOUBLE",
@@ -55,6 +57,45 @@ ALIAS_MAPPING = {
     "DATETIME": "TIMESTAMP_NTZ",  # DATETIME is an alias for TIMESTAMP_NTZ
     "VARBINARY": "BINARY",
 }
+# Canonical names and aliases mapped to their normalized type, so normalization is a single lookup
+CANONICAL_SNOWFLAKE_DATA_TYPES: dict[str, NormalizedSnowflakeDataType] = {
+    **{t: t for t in NormalizedSnowflakeDataType.__args__},
+    **ALIAS_MAPPING,
+}
+
+
+StatisticsClassification = Literal["numeric", "string", "date", "boolean"]
+
+NUMERIC_DATA_TYPES: frozenset[NormalizedSnowflakeDataType] = frozenset({
+    "NUMBER",
+    "DECIMAL",
+    "INT",
+    "BIGINT",
+    "SMALLINT",
+    "TINYINT",
+    "BYTEINT",
+    "FLOAT",
+    "DOUBLE",
+    "REAL",
+})
+STRING_DATA_TYPES: frozenset[NormalizedSnowflakeDataType] = frozenset({"VARCHAR", "CHAR", "STRING", "TEXT"})
+DATE_DATA_TYPES: frozenset[NormalizedSnowflakeDataType] = frozenset({
+    "DATE",
+    "TIME",
+    "TIMESTAMP",
+    "TIMESTAMP_LTZ",
+    "TIMESTAMP_NTZ",
+    "TIMESTAMP_TZ",
+})
+BOOLEAN_DATA_TYPES: frozenset[NormalizedSnowflakeDataType] = frozenset({"BOOLEAN"})
+
+# Statistics classification per normalized type, resolved once instead of per instance
+STATISTICS_CLASSIFICATION: dict[NormalizedSnowflakeDataType, StatisticsClassification] = {
+    **dict.fromkeys(NUMERIC_DATA_TYPES, "numeric"),
+    **dict.fromkeys(STRING_DATA_TYPES, "string"),
+    **dict.fromkeys(DATE_DATA_TYPES, "date"),
+    **dict.fromkeys(BOOLEAN_DATA_TYPES, "boolean"),
+}
 
 
 def is_normalized_snowflake_data_type(s: str) -> TypeGuard[NormalizedSnowflakeDataType]:
@@ -62,7 +103,7 @@ def is_normalized_snowflake_data_type(s: str) -> TypeGuard[NormalizedSnowflakeDa
     return s in NORMALIZED_SNOWFLAKE_DATA_TYPES
 
 
-@attrs.define(frozen=True)
+@attrs.define(frozen=True, slots=True)
 class SnowflakeDataType:
     """Snowflake data type representation."""
 
@@ -76,12 +117,13 @@ class SnowflakeDataType:
         object.__setattr__(self, "normalized_type", normalized)
 
     @classmethod
-    def from_raw_str(cls, s: str) -> Self | None:
-        """Create SnowflakeDataType from raw string, returning None for unsupported types."""
-        normalized = cls._normalize_raw_type(s)
-        if normalized is None:
-            return None
-        return cls(s)
+    def from_raw_str(cls, s: str) -> "SnowflakeDataType | None":
+        """Create SnowflakeDataType from raw string, returning None for unsupported types.
+
+        Instances are interned per raw string: catalogs repeat a small set of type
+        strings across many columns, so each one is normalized only once.
+        """
+        return _snowflake_data_type_from_raw_str(s)
 
     @staticmethod
     def _normalize_raw_type(s: str) -> NormalizedSnowflakeDataType | None:
@@ -90,85 +132,52 @@ class SnowflakeDataType:
 
         Returns None if the type is not supported.
         """
-        upper_type = s.upper().strip()
-        if not upper_type:
-            return None
+        # Fast path for input that needs no case folding, such as catalog DATA_TYPE values
+        normalized = CANONICAL_SNOWFLAKE_DATA_TYPES.get(s)
+        if normalized is not None:
+            return normalized
 
         # Remove parentheses and their contents (e.g., VARCHAR(255) -> VARCHAR)
-        if "(" in upper_type:
-            upper_type = upper_type.split("(")[0]
-
-        # Apply alias conversion
-        normalized = ALIAS_MAPPING.get(upper_type, upper_type)
-
-        # Type safety check: return None if not in Literal
-        if not is_normalized_snowflake_data_type(normalized):
-            return None
-
-        return normalized
+        # and apply alias conversion
+        return CANONICAL_SNOWFLAKE_DATA_TYPES.get(s.upper().strip().partition("(")[0])
 
     def is_numeric(self) -> bool:
         """Check if the data type is numeric"""
-        return self.normalized_type in {
-            "NUMBER",
-            "DECIMAL",
-            "INT",
-            "BIGINT",
-            "SMALLINT",
-            "TINYINT",
-            "BYTEINT",
-            "FLOAT",
-            "DOUBLE",
-            "REAL",
-        }
+        return self.normalized_type in NUMERIC_DATA_TYPES
 
     def is_string(self) -> bool:
         """Check if the data type is string"""
-        return self.normalized_type in {"VARCHAR", "CHAR", "STRING", "TEXT"}
+        return self.normalized_type in STRING_DATA_TYPES
 
     def is_date(self) -> bool:
         """Check if the data type is date/time"""
-        return self.normalized_type in {
-            "DATE",
-            "TIME",
-            "TIMESTAMP",
-            "TIMESTAMP_LTZ",
-            "TIMESTAMP_NTZ",
-            "TIMESTAMP_TZ",
-        }
+        return self.normalized_type in DATE_DATA_TYPES
 
     def is_boolean(self) -> bool:
         """Check if the data type is boolean"""
-        return self.normalized_type == "BOOLEAN"
+        return self.normalized_type in BOOLEAN_DATA_TYPES
 
     def is_supported_for_statistics(self) -> bool:
         """Check if the data type is supported for statistical analysis"""
-        return self.is_numeric() or self.is_string() or self.is_date() or self.is_boolean()
+        return self.normalized_type in STATISTICS_CLASSIFICATION
 
 
-@attrs.define(frozen=True)
+@attrs.define(frozen=True, slots=True)
 class StatisticsSupportDataType:
     """Statistics-specific data type classification."""
 
     snowflake_type: SnowflakeDataType
-    _classification: Literal["numeric", "string", "date", "boolean"] = attrs.field(init=False)
+    _classification: StatisticsClassification = attrs.field(init=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialize classification based on snowflake_type."""
-        if self.snowflake_type.is_numeric():
-            classification = "numeric"
-        elif self.snowflake_type.is_string():
-            classification = "string"
-        elif self.snowflake_type.is_date():
-            classification = "date"
-        elif self.snowflake_type.is_boolean():
-            classification = "boolean"
-        else:
+        classification = STATISTICS_CLASSIFICATION.get(self.snowflake_type.normalized_type)
+        if classification is None:
             raise ValueError(f"Unsupported Snowflake data type for statistics: {self.snowflake_type.raw_type}")
         object.__setattr__(self, "_classification", classification)
 
     @property
-    def type_name(self) -> Literal["numeric", "string", "date", "boolean"]:
+    def type_name(self) -> StatisticsClassification:
         """Get the classification type name."""
         return self._classification
 
@@ -176,9 +185,24 @@ class StatisticsSupportDataType:
     def from_snowflake_type(
         cls,
         sf_type: SnowflakeDataType,
-    ) -> Self | None:
-        """Convert SnowflakeDataType to StatisticsSupportDataType, returning None for unsupported types."""
-        try:
-            return cls(sf_type)
-        except ValueError:
-            return None
+    ) -> "StatisticsSupportDataType | None":
+        """Convert SnowflakeDataType to StatisticsSupportDataType, returning None for unsupported types.
+
+        Results are interned per SnowflakeDataType.
+        """
+        return _statistics_support_data_type_from_snowflake_type(sf_type)
+
+
+@lru_cache(maxsize=512)
+def _snowflake_data_type_from_raw_str(s: str) -> SnowflakeDataType | None:
+    try:
+        return SnowflakeDataType(s)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _statistics_support_data_type_from_snowflake_type(sf_type: SnowflakeDataType) -> StatisticsSupportDataType | None:
+    if not sf_type.is_supported_for_statistics():
+        return None
+    return StatisticsSupportDataType(sf_type)
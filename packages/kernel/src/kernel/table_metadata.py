@@ -47,14 +47,14 @@ class TableColumn:
     ordinal_position: int
     default_value: str | None = None
     comment: str | None = None
+    # Derived from data_type once at construction
+    statistics_type: StatisticsSupportDataType | None = attrs.field(init=False, eq=False, repr=False)
 
-    @property
-    def statistics_type(self) -> StatisticsSupportDataType | None:
-        """Get the statistics support data type for this column."""
-        return StatisticsSupportDataType.from_snowflake_type(self.data_type)
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, "statistics_type", StatisticsSupportDataType.from_snowflake_type(self.data_type))
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, eq=False)
 class TableInfo:
     """Domain model for table information."""
 
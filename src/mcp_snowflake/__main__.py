@@ -32,7 +32,7 @@ server_context = ServerContext()
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
-    return [tool.definition for tool in server_context.tools()]
+    return server_context.tool_definitions()
 
 
 @server.call_tool()
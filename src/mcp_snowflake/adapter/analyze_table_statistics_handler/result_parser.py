@@ -71,11 +71,12 @@ def parse_statistics_result(
         data_type = col_info.data_type.raw_type  # Use raw_type for JSON serialization
         col_type = col_info.statistics_type.type_name
         prefix = f"{col_type}_{col_name}".upper()  # Convert to uppercase for Snowflake
+        # COUNT(col) skips NULLs, so the null count is TOTAL_ROWS minus COUNT(col)
 
         match col_type:
             case "numeric":
                 count = int(result_row[f"{prefix}_COUNT"])
-                null_count = int(result_row[f"{prefix}_NULL_COUNT"])
+                null_count = total_rows - count
                 stats = NumericStatsDict(
                     column_type="numeric",
                     data_type=data_type,
@@ -100,7 +101,8 @@ def parse_statistics_result(
 
                 if top_values_raw is None:
                     logger.error(
-                        f"{prefix}_TOP_VALUES is required for string column but was None",
+                        "%s_TOP_VALUES is required for string column but was None",
+                        prefix,
                         extra={"column": col_name, "prefix": prefix},
                     )
                     raise StatisticsResultParseError(f"{prefix}_TOP_VALUES is required for string column but was None")
@@ -109,7 +111,8 @@ def parse_statistics_result(
                     raw_values = cast("list[Any]", json.loads(top_values_raw)) if top_values_raw else []
                 except (json.JSONDecodeError, TypeError) as e:
                     logger.error(
-                        f"Failed to parse {prefix}_TOP_VALUES JSON",
+                        "Failed to parse %s_TOP_VALUES JSON",
+                        prefix,
                         extra={
                             "column": col_name,
                             "raw_value": top_values_raw,
@@ -126,7 +129,7 @@ def parse_statistics_result(
                     col_name,
                 )
                 count = int(result_row[f"{prefix}_COUNT"])
-                null_count = int(result_row[f"{prefix}_NULL_COUNT"])
+                null_count = total_rows - count
 
                 stats = StringStatsDict(
                     column_type="string",
@@ -156,7 +159,7 @@ def parse_statistics_result(
                 min_date = result_row[f"{prefix}_MIN"]
                 max_date = result_row[f"{prefix}_MAX"]
                 count = int(result_row[f"{prefix}_COUNT"])
-                null_count = int(result_row[f"{prefix}_NULL_COUNT"])
+                null_count = total_rows - count
 
                 stats = DateStatsDict(
                     column_type="date",
@@ -175,7 +178,7 @@ def parse_statistics_result(
                     )
             case "boolean":
                 count = int(result_row[f"{prefix}_COUNT"])
-                null_count = int(result_row[f"{prefix}_NULL_COUNT"])
+                null_count = total_rows - count
                 stats = BooleanStatsDict(
                     column_type="boolean",
                     data_type=data_type,
@@ -243,7 +246,8 @@ def parse_top_values[T](
     for item in raw_top_values:
         if not isinstance(item, list) or len(item) != 2:
             logger.error(
-                f"Invalid top_values element structure for column {column_name}",
+                "Invalid top_values element structure for column %s",
+                column_name,
                 extra={"column": column_name, "invalid_item": item},
             )
             raise StatisticsResultParseError(f"Invalid top_values element for column {column_name}: {item!r}")
@@ -253,7 +257,8 @@ def parse_top_values[T](
         # Check value type
         if not (isinstance(value_raw, value_cls) or value_raw is None):
             logger.error(
-                f"Invalid value type in top_values for column {column_name}",
+                "Invalid value type in top_values for column %s",
+                column_name,
                 extra={
                     "column": column_name,
                     "expected_type": value_cls.__name__,
@@ -269,7 +274,8 @@ def parse_top_values[T](
             top_value = TopValue(value_raw, count_int)
         except (ValueError, TypeError) as e:
             logger.error(
-                f"Invalid count in top_values for column {column_name}",
+                "Invalid count in top_values for column %s",
+                column_name,
                 extra={
                     "column": column_name,
                     "count_raw": count_raw,
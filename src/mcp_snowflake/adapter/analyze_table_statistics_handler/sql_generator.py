@@ -1,7 +1,9 @@
 """SQL generation functionality for table statistics analysis."""
 
 from collections.abc import Iterable
+from functools import lru_cache
 
+from kernel.data_types import StatisticsClassification
 from kernel.statistics_support_column import StatisticsSupportColumn
 from kernel.table_metadata import DataBase, Schema, Table
 
@@ -18,6 +20,9 @@ def generate_statistics_sql(
 ) -> str:
     """Generate SQL query for analyzing table statistics.
 
+    The SQL depends only on the table reference, the column names and their
+    statistics types, and the options, so it is cached by that fingerprint.
+
     Parameters
     ----------
     database : DataBase
@@ -40,23 +45,39 @@ def generate_statistics_sql(
     str
         The generated SQL query.
     """
-    table_ref = f'"{database}"."{schema}"."{table}"'
+    columns = tuple((col_info.name, col_info.statistics_type.type_name) for col_info in columns_info)
+    return _build_statistics_sql(
+        f'"{database}"."{schema}"."{table}"',
+        columns,
+        top_k_limit,
+        include_null_empty_profile=include_null_empty_profile,
+        include_blank_string_profile=include_blank_string_profile,
+    )
 
-    sql_parts = ["SELECT", "  COUNT(*) as total_rows,"]
 
-    for col_info in columns_info:
-        col_name = col_info.name
-        col_type = col_info.statistics_type.type_name
+@lru_cache(maxsize=256)
+def _build_statistics_sql(
+    table_ref: str,
+    columns: tuple[tuple[str, StatisticsClassification], ...],
+    top_k_limit: int,
+    *,
+    include_null_empty_profile: bool,
+    include_blank_string_profile: bool,
+) -> str:
+    """Build the statistics SQL for a quoted table reference and (name, type) column pairs."""
+    sql_parts = ["SELECT", "  COUNT(*) as total_rows,"]
 
+    for col_name, col_type in columns:
         # Use escaped column names to handle special characters
         escaped_col = f'"{col_name}"'
         prefix = f"{col_type}_{col_name}"
 
+        # Non-null count is common to every statistics type
+        sql_parts.append(f"  COUNT({escaped_col}) as {prefix}_count,")
+
         match col_type:
             case "numeric":
                 sql_parts.extend([
-                    f"  COUNT({escaped_col}) as {prefix}_count,",
-                    f"  SUM(CASE WHEN {escaped_col} IS NULL THEN 1 ELSE 0 END) as {prefix}_null_count,",
                     f"  MIN({escaped_col}) as {prefix}_min,",
                     f"  MAX({escaped_col}) as {prefix}_max,",
                     f"  AVG({escaped_col}) as {prefix}_avg,",
@@ -67,8 +88,6 @@ def generate_statistics_sql(
                 ])
             case "string":
                 sql_parts.extend([
-                    f"  COUNT({escaped_col}) as {prefix}_count,",
-                    f"  SUM(CASE WHEN {escaped_col} IS NULL THEN 1 ELSE 0 END) as {prefix}_null_count,",
                     f"  MIN(LENGTH({escaped_col})) as {prefix}_min_length,",
                     f"  MAX(LENGTH({escaped_col})) as {prefix}_max_length,",
                     f"  APPROX_COUNT_DISTINCT({escaped_col}) as {prefix}_distinct,",
@@ -80,8 +99,6 @@ def generate_statistics_sql(
                         sql_parts.append(f"  COUNT_IF(TRIM({escaped_col}) = '') as {prefix}_blank_string_count,")
             case "date":
                 sql_parts.extend([
-                    f"  COUNT({escaped_col}) as {prefix}_count,",
-                    f"  SUM(CASE WHEN {escaped_col} IS NULL THEN 1 ELSE 0 END) as {prefix}_null_count,",
                     f"  MIN({escaped_col}) as {prefix}_min,",
                     f"  MAX({escaped_col}) as {prefix}_max,",
                     f"  DATEDIFF('day', MIN({escaped_col}), MAX({escaped_col})) as {prefix}_range_days,",
@@ -89,8 +106,6 @@ def generate_statistics_sql(
                 ])
             case "boolean":
                 sql_parts.extend([
-                    f"  COUNT({escaped_col}) as {prefix}_count,",
-                    f"  SUM(CASE WHEN {escaped_col} IS NULL THEN 1 ELSE 0 END) as {prefix}_null_count,",
                     f"  SUM(CASE WHEN {escaped_col} = TRUE THEN 1 ELSE 0 END) as {prefix}_true_count,",
                     f"  SUM(CASE WHEN {escaped_col} = FALSE THEN 1 ELSE 0 END) as {prefix}_false_count,",
                     f"  ROUND(DIV0NULL(SUM(CASE WHEN {escaped_col} = TRUE THEN 1 ELSE 0 END) * 100.0, COUNT({escaped_col})), 2) as {prefix}_true_percentage,",
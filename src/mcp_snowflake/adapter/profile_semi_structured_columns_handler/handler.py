@@ -21,9 +21,8 @@ from .result_parser import (
 from .sql_generator import (
     generate_column_profile_sql,
     generate_path_profile_sql,
-    generate_sampled_rows_sql,
+    generate_row_counts_sql,
     generate_top_level_keys_sql,
-    generate_total_rows_sql,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,16 +55,11 @@ class ProfileSemiStructuredColumnsEffectHandler(DescribeTableEffectHandler):
         include_value_samples: bool,  # noqa: FBT001
     ) -> SemiStructuredProfileParseResult:
         """Execute profiling queries and return parsed result."""
-        total_rows_sql = generate_total_rows_sql(database, schema, table)
-        sampled_rows_sql = generate_sampled_rows_sql(database, schema, table, sample_rows)
+        row_counts_sql = generate_row_counts_sql(database, schema, table, sample_rows)
 
         try:
-            total_rows_result = await self.client.execute_query(
-                total_rows_sql,
-                self.base_query_timeout,
-            )
-            sampled_rows_result = await self.client.execute_query(
-                sampled_rows_sql,
+            row_counts_result = await self.client.execute_query(
+                row_counts_sql,
                 self.base_query_timeout,
             )
         except Exception:
@@ -84,13 +78,10 @@ class ProfileSemiStructuredColumnsEffectHandler(DescribeTableEffectHandler):
             )
             raise
 
-        if not total_rows_result:
-            raise SemiStructuredProfileResultParseError("No rows returned for total row count")
-        total_rows = parse_count_value(total_rows_result[0], "TOTAL_ROWS")
-
-        if not sampled_rows_result:
-            raise SemiStructuredProfileResultParseError("No rows returned for sampled row count")
-        sampled_rows = parse_count_value(sampled_rows_result[0], "SAMPLED_ROWS")
+        if not row_counts_result:
+            raise SemiStructuredProfileResultParseError("No rows returned for row counts")
+        total_rows = parse_count_value(row_counts_result[0], "TOTAL_ROWS")
+        sampled_rows = parse_count_value(row_counts_result[0], "SAMPLED_ROWS")
 
         column_profiles = {}
         path_profiles = []
@@ -7,21 +7,19 @@ NUMBER_TYPE_NAMES = "'NUMBER', 'DECIMAL', 'INT', 'INTEGER', 'FLOAT', 'DOUBLE', '
 STRING_TYPE_NAMES = "'VARCHAR', 'CHAR', 'TEXT', 'STRING'"
 
 
-def generate_total_rows_sql(database: DataBase, schema: Schema, table: Table) -> str:
-    """Generate SQL to count total rows in the target table."""
-    table_ref = fully_qualified(database, schema, table)
-    return f"SELECT COUNT(*) AS TOTAL_ROWS FROM {table_ref};"  # noqa: S608
-
-
-def generate_sampled_rows_sql(
+def generate_row_counts_sql(
     database: DataBase,
     schema: Schema,
     table: Table,
     sample_rows: int,
 ) -> str:
-    """Generate SQL to count sampled rows."""
+    """Generate SQL to count total and sampled rows in a single statement."""
     table_ref = fully_qualified(database, schema, table)
-    return f"SELECT COUNT(*) AS SAMPLED_ROWS FROM {table_ref} SAMPLE ROW ({sample_rows} ROWS);"  # noqa: S608
+    return f"""
+SELECT
+  (SELECT COUNT(*) FROM {table_ref}) AS TOTAL_ROWS,
+  (SELECT COUNT(*) FROM {table_ref} SAMPLE ROW ({sample_rows} ROWS)) AS SAMPLED_ROWS;
+"""  # noqa: S608
 
 
 def generate_column_profile_sql(
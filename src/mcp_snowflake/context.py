@@ -3,6 +3,8 @@
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 
+import mcp.types as types
+
 from cattrs_converter import JsonImmutableConverter
 
 from .adapter import (
@@ -52,6 +54,7 @@ class ServerContext:
         self._snowflake_client: SnowflakeClient | None = None
         self._json_converter = JsonImmutableConverter()
         self._tools: dict[str, Tool] = {}
+        self._tool_definitions: list[types.Tool] = []
 
     def prepare(
         self,
@@ -146,6 +149,8 @@ class ServerContext:
         enabled_tools = [tool for tool in all_tools if tool.name in enabled_tool_names]
 
         self._tools = {tool.name: tool for tool in enabled_tools}
+        # Tools are fixed after prepare, so build their definitions only once
+        self._tool_definitions = [tool.definition for tool in enabled_tools]
 
     def is_available(self) -> bool:
         """Check if the context is available for use.
@@ -167,6 +172,16 @@ class ServerContext:
         """
         yield from self._tools.values()
 
+    def tool_definitions(self) -> list[types.Tool]:
+        """Get the definitions of all available tools.
+
+        Returns
+        -------
+        list[types.Tool]
+            Definitions of all enabled tools, built once in ``prepare``.
+        """
+        return list(self._tool_definitions)
+
     def tool(self, name: str) -> Tool | None:
         """Get a specific tool by name.
 
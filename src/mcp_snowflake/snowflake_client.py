@@ -4,8 +4,11 @@ Snowflake client for MCP server.
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
 from snowflake.connector import (
@@ -38,8 +41,13 @@ class SnowflakeClient:
         self.thread_pool_executor = thread_pool_executor
         self.settings = settings
 
-    def _get_connection(self) -> SnowflakeConnection:
-        """Create a Snowflake connection."""
+    @cached_property
+    def _connection_params(self) -> Mapping[str, Any]:
+        """Snowflake connection parameters, built from settings on first connection.
+
+        The password is validated here but deliberately left out, so the secret is only
+        held in plain text while a connection is being opened.
+        """
         conn_params: dict[str, Any] = {
             "account": self.settings.account,
             "user": self.settings.user,
@@ -51,10 +59,22 @@ class SnowflakeClient:
         if self.settings.authenticator == DEFAULT_AUTHENTICATOR:
             if self.settings.password is None:
                 raise ValueError("password is required when authenticator is SNOWFLAKE")
-            conn_params["password"] = self.settings.password.get_secret_value()
         else:
             conn_params["client_store_temporary_credential"] = self.settings.client_store_temporary_credential
 
+        return MappingProxyType(conn_params)
+
+    def _get_connection(self) -> SnowflakeConnection:
+        """Create a Snowflake connection."""
+        conn_params = self._connection_params
+        password = self.settings.password
+        if self.settings.authenticator == DEFAULT_AUTHENTICATOR and password is not None:
+            return SnowflakeConnection(
+                connection_name=None,
+                connections_file_path=None,
+                password=password.get_secret_value(),
+                **conn_params,
+            )
         return SnowflakeConnection(
             connection_name=None,
             connections_file_path=None,
@@ -97,7 +117,7 @@ class SnowflakeClient:
             except ProgrammingError as e:
                 if e.errno == 604:
                     # see: https://docs.snowflake.com/ja/developer-guide/python-connector/python-connector-example#using-cursor-to-fetch-values
-                    logger.exception(f"Query execution timed out after {timeout_seconds} seconds")
+                    logger.exception("Query execution timed out after %d seconds", timeout_seconds)
                     raise TimeoutError(f"Query execution timed out after {timeout_seconds} seconds") from e
                 logger.exception("Query execution error")
                 raise
@@ -152,7 +172,7 @@ class SnowflakeClient:
         if query_timeout is None:
             query_timeout = timedelta(seconds=30)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self.thread_pool_executor,
             self._execute_query_sync,
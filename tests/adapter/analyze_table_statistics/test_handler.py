@@ -35,7 +35,6 @@ class TestAnalyzeTableStatisticsEffectHandler:
                 {
                     "TOTAL_ROWS": 100,
                     "NUMERIC_PRICE_COUNT": 100,
-                    "NUMERIC_PRICE_NULL_COUNT": 0,
                     "NUMERIC_PRICE_MIN": 1.0,
                     "NUMERIC_PRICE_MAX": 100.0,
                     "NUMERIC_PRICE_AVG": 50.0,
@@ -80,7 +79,6 @@ class TestAnalyzeTableStatisticsEffectHandler:
                 {
                     "TOTAL_ROWS": 100,
                     "NUMERIC_PRICE_COUNT": 100,
-                    "NUMERIC_PRICE_NULL_COUNT": 0,
                     "NUMERIC_PRICE_MIN": 1.0,
                     "NUMERIC_PRICE_MAX": 100.0,
                     "NUMERIC_PRICE_AVG": 50.0,
@@ -43,7 +43,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "NUMERIC_PRICE_COUNT": 1000,
-            "NUMERIC_PRICE_NULL_COUNT": 0,
             "NUMERIC_PRICE_MIN": 10.5,
             "NUMERIC_PRICE_MAX": 999.99,
             "NUMERIC_PRICE_AVG": 505.25,
@@ -87,7 +86,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -129,7 +127,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "DATE_CREATED_DATE_COUNT": 1000,
-            "DATE_CREATED_DATE_NULL_COUNT": 0,
             "DATE_CREATED_DATE_MIN": "2023-01-01",
             "DATE_CREATED_DATE_MAX": "2023-12-31",
             "DATE_CREATED_DATE_RANGE_DAYS": 364,
@@ -180,7 +177,6 @@ class TestParseStatisticsResult:
             "TOTAL_ROWS": 1000,
             # Numeric column results
             "NUMERIC_PRICE_COUNT": 1000,
-            "NUMERIC_PRICE_NULL_COUNT": 0,
             "NUMERIC_PRICE_MIN": 10.5,
             "NUMERIC_PRICE_MAX": 999.99,
             "NUMERIC_PRICE_AVG": 505.25,
@@ -190,14 +186,12 @@ class TestParseStatisticsResult:
             "NUMERIC_PRICE_DISTINCT": 950,
             # String column results
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 1,
             "STRING_STATUS_DISTINCT": 3,
             "STRING_STATUS_TOP_VALUES": '[["A", 400], ["B", 350], ["C", 250]]',
             # Date column results
             "DATE_CREATED_DATE_COUNT": 1000,
-            "DATE_CREATED_DATE_NULL_COUNT": 0,
             "DATE_CREATED_DATE_MIN": "2023-01-01",
             "DATE_CREATED_DATE_MAX": "2023-12-31",
             "DATE_CREATED_DATE_RANGE_DAYS": 364,
@@ -245,7 +239,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "NUMERIC_PRICE_COUNT": 500,
-            "NUMERIC_PRICE_NULL_COUNT": 500,
             "NUMERIC_PRICE_MIN": None,
             "NUMERIC_PRICE_MAX": None,
             "NUMERIC_PRICE_AVG": None,
@@ -282,7 +275,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -312,7 +304,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -342,7 +333,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "BOOLEAN_IS_ACTIVE_COUNT": 950,
-            "BOOLEAN_IS_ACTIVE_NULL_COUNT": 50,
             "BOOLEAN_IS_ACTIVE_TRUE_COUNT": 720,
             "BOOLEAN_IS_ACTIVE_FALSE_COUNT": 230,
             "BOOLEAN_IS_ACTIVE_TRUE_PERCENTAGE": 75.79,
@@ -384,7 +374,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "BOOLEAN_IS_ACTIVE_COUNT": 0,
-            "BOOLEAN_IS_ACTIVE_NULL_COUNT": 1000,
             "BOOLEAN_IS_ACTIVE_TRUE_COUNT": 0,
             "BOOLEAN_IS_ACTIVE_FALSE_COUNT": 0,
             "BOOLEAN_IS_ACTIVE_TRUE_PERCENTAGE": 0.0,  # DIV0NULL returns 0.0
@@ -422,7 +411,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -456,7 +444,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -487,7 +474,6 @@ class TestParseStatisticsResult:
         result_row = {
             # TOTAL_ROWS is missing
             "NUMERIC_PRICE_COUNT": 1000,
-            "NUMERIC_PRICE_NULL_COUNT": 0,
             "NUMERIC_PRICE_MIN": 10.5,
             "NUMERIC_PRICE_MAX": 999.99,
             "NUMERIC_PRICE_AVG": 505.25,
@@ -520,7 +506,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -551,7 +536,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 1000,
             "STRING_STATUS_COUNT": 1000,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
@@ -582,7 +566,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 10,
             "STRING_STATUS_COUNT": 8,
-            "STRING_STATUS_NULL_COUNT": 2,
             "STRING_STATUS_MIN_LENGTH": 0,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 4,
@@ -617,7 +600,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 10,
             "STRING_STATUS_COUNT": 8,
-            "STRING_STATUS_NULL_COUNT": 2,
             "STRING_STATUS_MIN_LENGTH": 0,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 4,
@@ -652,7 +634,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 0,
             "STRING_STATUS_COUNT": 0,
-            "STRING_STATUS_NULL_COUNT": 0,
             "STRING_STATUS_MIN_LENGTH": None,
             "STRING_STATUS_MAX_LENGTH": None,
             "STRING_STATUS_DISTINCT": 0,
@@ -694,7 +675,6 @@ class TestParseStatisticsResult:
         result_row = {
             "TOTAL_ROWS": 100,
             "NUMERIC_PRICE_COUNT": 100,
-            "NUMERIC_PRICE_NULL_COUNT": 0,
             "NUMERIC_PRICE_MIN": 1.0,
             "NUMERIC_PRICE_MAX": 100.0,
             "NUMERIC_PRICE_AVG": 50.5,
@@ -703,7 +683,6 @@ class TestParseStatisticsResult:
             "NUMERIC_PRICE_Q3": 75.0,
             "NUMERIC_PRICE_DISTINCT": 100,
             "STRING_STATUS_COUNT": 90,
-            "STRING_STATUS_NULL_COUNT": 10,
             "STRING_STATUS_MIN_LENGTH": 1,
             "STRING_STATUS_MAX_LENGTH": 10,
             "STRING_STATUS_DISTINCT": 3,
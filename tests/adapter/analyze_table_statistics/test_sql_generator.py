@@ -151,6 +151,10 @@ class TestGenerateStatisticsSQL:
         # Ensure no trailing comma
         assert not sql.rstrip().endswith(",")
 
+        # Null counts are derived from TOTAL_ROWS - COUNT(col) by the parser
+        assert "IS NULL" not in sql
+        assert "null_count" not in sql
+
     def test_column_name_escaping(self) -> None:
         """Test that column names are properly escaped."""
         columns_info = [
@@ -247,7 +251,6 @@ class TestGenerateStatisticsSQL:
 
         # Check boolean-specific aggregations
         assert 'COUNT("is_active") as boolean_is_active_count' in sql
-        assert 'SUM(CASE WHEN "is_active" IS NULL THEN 1 ELSE 0 END) as boolean_is_active_null_count' in sql
         assert 'SUM(CASE WHEN "is_active" = TRUE THEN 1 ELSE 0 END) as boolean_is_active_true_count' in sql
         assert 'SUM(CASE WHEN "is_active" = FALSE THEN 1 ELSE 0 END) as boolean_is_active_false_count' in sql
 
@@ -348,3 +351,41 @@ class TestGenerateStatisticsSQL:
 
         assert "empty_string_count" not in sql
         assert "blank_string_count" not in sql
+
+    def test_same_columns_and_options_reuse_generated_sql(self) -> None:
+        """Test that identical inputs return the cached SQL and differing inputs do not."""
+        columns_info = [
+            TableColumn(
+                name="status",
+                data_type="VARCHAR(50)",
+                nullable=True,
+                ordinal_position=1,
+            ),
+        ]
+        stats_columns = _convert_to_statistics_support_columns(columns_info)
+
+        sql = generate_statistics_sql(
+            DataBase("TEST_DB"),
+            Schema("TEST_SCHEMA"),
+            Table("TEST_TABLE"),
+            stats_columns,
+            10,
+        )
+        sql_again = generate_statistics_sql(
+            DataBase("TEST_DB"),
+            Schema("TEST_SCHEMA"),
+            Table("TEST_TABLE"),
+            iter(stats_columns),
+            10,
+        )
+        sql_other_limit = generate_statistics_sql(
+            DataBase("TEST_DB"),
+            Schema("TEST_SCHEMA"),
+            Table("TEST_TABLE"),
+            stats_columns,
+            20,
+        )
+
+        assert sql_again is sql
+        assert sql_other_limit != sql
+        assert 'APPROX_TOP_K("status", 20)' in sql_other_limit
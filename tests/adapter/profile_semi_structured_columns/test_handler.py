@@ -0,0 +1,65 @@
+"""Tests for ProfileSemiStructuredColumnsEffectHandler."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from kernel.table_metadata import DataBase, Schema, Table
+from mcp_snowflake.adapter.profile_semi_structured_columns_handler.handler import (
+    ProfileSemiStructuredColumnsEffectHandler,
+)
+from mcp_snowflake.handler.profile_semi_structured_columns.models import (
+    SemiStructuredProfileResultParseError,
+)
+
+
+class TestProfileSemiStructuredColumnsEffectHandler:
+    """Test query orchestration in ProfileSemiStructuredColumnsEffectHandler."""
+
+    @pytest.mark.asyncio
+    async def test_row_counts_use_a_single_query(self) -> None:
+        """Total and sampled row counts should come from one query on one connection."""
+        mock_client = Mock()
+        mock_client.execute_query = AsyncMock(return_value=[{"TOTAL_ROWS": 100, "SAMPLED_ROWS": 10}])
+        handler = ProfileSemiStructuredColumnsEffectHandler(mock_client, base_query_timeout_seconds=45)
+
+        result = await handler.profile_semi_structured_columns(
+            DataBase("TEST_DB"),
+            Schema("TEST_SCHEMA"),
+            Table("TEST_TABLE"),
+            [],
+            sample_rows=10,
+            max_depth=3,
+            top_k_limit=5,
+            include_path_stats=False,
+            include_value_samples=False,
+        )
+
+        assert result.total_rows == 100
+        assert result.sampled_rows == 10
+        mock_client.execute_query.assert_awaited_once()
+        query, timeout = mock_client.execute_query.await_args.args
+        assert "AS TOTAL_ROWS" in query
+        assert "AS SAMPLED_ROWS" in query
+        assert timeout == timedelta(seconds=45)
+
+    @pytest.mark.asyncio
+    async def test_row_counts_without_rows_raise_parse_error(self) -> None:
+        """An empty row count result should raise a parse error."""
+        mock_client = Mock()
+        mock_client.execute_query = AsyncMock(return_value=[])
+        handler = ProfileSemiStructuredColumnsEffectHandler(mock_client)
+
+        with pytest.raises(SemiStructuredProfileResultParseError, match="No rows returned for row counts"):
+            _ = await handler.profile_semi_structured_columns(
+                DataBase("TEST_DB"),
+                Schema("TEST_SCHEMA"),
+                Table("TEST_TABLE"),
+                [],
+                sample_rows=10,
+                max_depth=3,
+                top_k_limit=5,
+                include_path_stats=False,
+                include_value_samples=False,
+            )
@@ -4,29 +4,23 @@ from kernel.table_metadata import DataBase, Schema, Table
 from mcp_snowflake.adapter.profile_semi_structured_columns_handler.sql_generator import (
     generate_column_profile_sql,
     generate_path_profile_sql,
-    generate_sampled_rows_sql,
+    generate_row_counts_sql,
     generate_top_level_keys_sql,
-    generate_total_rows_sql,
 )
 
 
-def test_generate_total_and_sampled_rows_sql() -> None:
-    """Should generate total/sample count SQL with qualified table names."""
-    total_sql = generate_total_rows_sql(
-        DataBase("MY_DB"),
-        Schema("MY_SCHEMA"),
-        Table("MY_TABLE"),
-    )
-    sampled_sql = generate_sampled_rows_sql(
+def test_generate_row_counts_sql() -> None:
+    """Should count total and sampled rows in one statement with qualified table names."""
+    sql = generate_row_counts_sql(
         DataBase("MY_DB"),
         Schema("MY_SCHEMA"),
         Table("MY_TABLE"),
         1234,
     )
 
-    assert "COUNT(*) AS TOTAL_ROWS" in total_sql
-    assert "MY_DB.MY_SCHEMA.MY_TABLE" in total_sql
-    assert "SAMPLE ROW (1234 ROWS)" in sampled_sql
+    assert "(SELECT COUNT(*) FROM MY_DB.MY_SCHEMA.MY_TABLE) AS TOTAL_ROWS" in sql
+    assert "SAMPLE ROW (1234 ROWS)) AS SAMPLED_ROWS" in sql
+    assert sql.count("SELECT") == 3
 
 
 def test_generate_column_profile_sql() -> None:
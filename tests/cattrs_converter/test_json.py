@@ -2,6 +2,7 @@
 Tests for JSON converter functionality.
 """
 
+import enum
 import json
 from datetime import UTC, date, datetime
 from decimal import Decimal
@@ -16,6 +17,7 @@ from hypothesis import strategies as st
 from cattrs_converter import (
     Jsonable,
     JsonImmutableConverter,
+    is_json_compatible_type,
 )
 
 
@@ -145,6 +147,12 @@ class TestJsonImmutableConverter:
         # Should contain the same elements (order may differ)
         assert set(result) == int_set
 
+    @given(st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none()))
+    def test_scalars_returned_as_is(self, converter: JsonImmutableConverter, value: Any) -> None:
+        """Test that JSON scalars are returned without copying or conversion."""
+        assert converter.unstructure(value) is value
+        assert converter.unstructure_safely(value) is value
+
     def test_unsupported_types(self, converter: JsonImmutableConverter) -> None:
         """Test types that remain unsupported after cattrs conversion."""
         # Complex number
@@ -230,8 +238,91 @@ class TestRegisterUnstructureHook:
             CustomType,
             custom_type_hook,
         )
+        assert isinstance(new_converter, JsonImmutableConverter)
         result = new_converter.unstructure(CustomType(42))
         assert result == {"custom_value": 42}
+        assert new_converter.unstructure_safely(Lock()) == "<unsupported_type: lock>"
 
         result = converter.unstructure_safely(CustomType(42))
         assert result == "<unsupported_type: CustomType>"
+
+    def test_register_unstructure_hook_for_scalar_type(
+        self,
+        converter: JsonImmutableConverter,
+    ) -> None:
+        new_converter = converter.register_unstructure_hook(str, str.upper)
+
+        assert new_converter.unstructure("abc") == "ABC"
+        assert new_converter.unstructure_safely("abc") == "ABC"
+        assert new_converter.try_unstructure("abc") == ("ABC", True)
+        assert new_converter.try_unstructure_fn(str)("abc") == ("ABC", True)
+        assert new_converter.unstructure_batch([{"a": "abc", "b": 1}]) == ([{"a": "ABC", "b": 1}], [])
+
+        # Hooks for other scalar types are still passed through, and so is the original converter
+        assert new_converter.unstructure(1) == 1
+        assert converter.unstructure("abc") == "abc"
+
+        # Registrations accumulate on derived converters
+        newest = new_converter.register_unstructure_hook(int, lambda value: value * 2)
+        assert newest.unstructure("abc") == "ABC"
+        assert newest.unstructure(21) == 42
+
+        # A hook for int also covers its subclass bool, as it does in cattrs
+        assert newest.unstructure(True) == 2
+        assert newest.unstructure_safely(True) == 2
+
+
+class TestIsJsonCompatibleType:
+    def test_deeply_nested_containers(self) -> None:
+        value: Jsonable = "leaf"
+        for depth in range(5000):
+            value = [value] if depth % 2 else {"nested": value}
+
+        assert is_json_compatible_type(value)
+
+    def test_reference_cycles_are_rejected(self) -> None:
+        cyclic_list: list[Any] = [1]
+        cyclic_list.append(cyclic_list)
+        cyclic_dict: dict[str, Any] = {"a": 1}
+        cyclic_dict["self"] = {"inner": [cyclic_dict]}
+
+        assert not is_json_compatible_type(cyclic_list)
+        assert not is_json_compatible_type(cyclic_dict)
+        assert not is_json_compatible_type([{"nested": cyclic_list}])
+
+    def test_shared_containers_are_not_cycles(self) -> None:
+        shared = {"leaf": [1, 2]}
+
+        assert is_json_compatible_type([shared, shared, {"again": shared}])
+
+    def test_scalar_and_container_subclasses(self) -> None:
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        class Row(dict[str, Any]):
+            pass
+
+        assert is_json_compatible_type(Level.HIGH)
+        assert is_json_compatible_type([Level.HIGH, Row(level=Level.HIGH)])
+        assert is_json_compatible_type(Row(items=[Row()]))
+
+    def test_string_subclass_keys(self, converter: JsonImmutableConverter) -> None:
+        class Key(enum.StrEnum):
+            A = "a"
+
+        value = {Key.A: 1, "nested": [{Key.A: None}]}
+
+        assert is_json_compatible_type(value)
+        assert converter.unstructure_safely(value) == value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, [2, [3, Lock()]]],
+            {"outer": {"inner": [Decimal("1.5")]}},
+            {"outer": [{1: "non-string key"}]},
+            [{"ok": None}, (1, 2)],
+        ],
+    )
+    def test_nested_unsupported_values(self, value: Any) -> None:
+        assert not is_json_compatible_type(value)
@@ -154,6 +154,25 @@ class TestContract:
         with pytest.raises(ContractViolationError):
             always_fails()
 
+    def test_returning_map_err_does_not_swallow_error(self) -> None:
+        """Test that a map_err which returns instead of raising cannot turn the failure into None."""
+
+        def returning_map_err(
+            err: Exception,  # noqa: ARG001
+            fn: Callable[..., Any],  # noqa: ARG001
+            args: tuple[Any, ...],  # noqa: ARG001
+            kwargs: dict[str, Any],  # noqa: ARG001
+        ) -> NoReturn:
+            return  # type: ignore[return-value]
+
+        @contract(map_err=returning_map_err)
+        def always_fails() -> int:
+            raise ValueError("This should not be swallowed")
+
+        with pytest.raises(RuntimeError, match="map_err must not return") as exc_info:
+            _ = always_fails()
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
 
 class TestContractViolationErrorEnhanced:
     """Test enhanced ContractViolationError with detailed context."""
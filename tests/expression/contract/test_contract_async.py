@@ -168,6 +168,26 @@ class TestContractAsync:
         with pytest.raises(ContractViolationError):
             await always_fails_async()
 
+    @pytest.mark.asyncio
+    async def test_returning_map_err_does_not_swallow_error_async(self) -> None:
+        """Test that a map_err which returns instead of raising cannot turn the failure into None."""
+
+        def returning_map_err(
+            err: Exception,  # noqa: ARG001
+            fn: Callable[..., Any],  # noqa: ARG001
+            args: tuple[Any, ...],  # noqa: ARG001
+            kwargs: dict[str, Any],  # noqa: ARG001
+        ) -> NoReturn:
+            return  # type: ignore[return-value]
+
+        @contract_async(map_err=returning_map_err)
+        async def always_fails_async() -> int:
+            raise ValueError("This should not be swallowed")
+
+        with pytest.raises(RuntimeError, match="map_err must not return") as exc_info:
+            _ = await always_fails_async()
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
 
 class TestMapErrEnhancedAsync:
     """Test enhanced map_err signature with async functions."""
@@ -68,7 +68,6 @@ def create_numeric_stats(
     return {
         "TOTAL_ROWS": total_rows,
         f"{prefix}_COUNT": total_rows,
-        f"{prefix}_NULL_COUNT": 0,
         f"{prefix}_MIN": min_val,
         f"{prefix}_MAX": max_val,
         f"{prefix}_AVG": avg_val,
@@ -92,7 +91,6 @@ def create_string_stats(
     return {
         "TOTAL_ROWS": total_rows,
         f"{prefix}_COUNT": total_rows,
-        f"{prefix}_NULL_COUNT": 0,
         f"{prefix}_MIN_LENGTH": min_length,
         f"{prefix}_MAX_LENGTH": max_length,
         f"{prefix}_DISTINCT": distinct_count,
@@ -104,7 +102,6 @@ def create_boolean_stats(
     column_name: str = "is_active",
     true_count: int = 720,
     false_count: int = 230,
-    null_count: int = 50,
     total_rows: int = 1000,
 ) -> dict[str, Any]:
     """Create boolean column statistics for test query results."""
@@ -114,7 +111,6 @@ def create_boolean_stats(
     return {
         "TOTAL_ROWS": total_rows,
         f"{prefix}_COUNT": non_null_count,
-        f"{prefix}_NULL_COUNT": null_count,
         f"{prefix}_TRUE_COUNT": true_count,
         f"{prefix}_FALSE_COUNT": false_count,
         f"{prefix}_TRUE_PERCENTAGE": round((true_count / non_null_count) * 100, 2),
@@ -39,7 +39,6 @@ class TestColumnSelection:
         query_result = {
             "TOTAL_ROWS": 100,
             "NUMERIC_ID_COUNT": 100,
-            "NUMERIC_ID_NULL_COUNT": 0,
             "NUMERIC_ID_MIN": 1.0,
             "NUMERIC_ID_MAX": 100.0,
             "NUMERIC_ID_AVG": 50.5,
@@ -88,7 +87,6 @@ class TestColumnSelection:
             {
                 "TOTAL_ROWS": 100,
                 "STRING_STATUS_COUNT": 100,
-                "STRING_STATUS_NULL_COUNT": 0,
                 "STRING_STATUS_MIN_LENGTH": 6,
                 "STRING_STATUS_MAX_LENGTH": 8,
                 "STRING_STATUS_DISTINCT": 3,
@@ -176,7 +174,6 @@ class TestColumnSelection:
         query_result = {
             "TOTAL_ROWS": 100,
             "NUMERIC_ID_COUNT": 100,
-            "NUMERIC_ID_NULL_COUNT": 0,
             "NUMERIC_ID_MIN": 1.0,
             "NUMERIC_ID_MAX": 100.0,
             "NUMERIC_ID_AVG": 50.5,
@@ -184,8 +181,7 @@ class TestColumnSelection:
             "NUMERIC_ID_MEDIAN": 50.0,
             "NUMERIC_ID_Q3": 75.0,
             "NUMERIC_ID_DISTINCT": 100,
-            "NUMERIC_PRICE_COUNT": 100,
-            "NUMERIC_PRICE_NULL_COUNT": 10,
+            "NUMERIC_PRICE_COUNT": 90,
             "NUMERIC_PRICE_MIN": 10.5,
             "NUMERIC_PRICE_MAX": 999.99,
             "NUMERIC_PRICE_AVG": 505.25,
@@ -239,7 +235,6 @@ class TestColumnSelection:
         query_result = {
             "TOTAL_ROWS": 50,
             "STRING_SINGLE_COL_COUNT": 45,
-            "STRING_SINGLE_COL_NULL_COUNT": 5,
             "STRING_SINGLE_COL_MIN_LENGTH": 1,
             "STRING_SINGLE_COL_MAX_LENGTH": 50,
             "STRING_SINGLE_COL_DISTINCT": 40,
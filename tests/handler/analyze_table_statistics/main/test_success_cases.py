@@ -116,7 +116,6 @@ class TestSuccessCases:
         query_result = {
             "TOTAL_ROWS": 1000,
             "BOOLEAN_IS_ACTIVE_COUNT": 950,
-            "BOOLEAN_IS_ACTIVE_NULL_COUNT": 50,
             "BOOLEAN_IS_ACTIVE_TRUE_COUNT": 720,
             "BOOLEAN_IS_ACTIVE_FALSE_COUNT": 230,
             "BOOLEAN_IS_ACTIVE_TRUE_PERCENTAGE": 75.79,
@@ -165,7 +164,6 @@ class TestSuccessCases:
         query_result = {
             "TOTAL_ROWS": 100,
             "NUMERIC_ID_COUNT": 100,
-            "NUMERIC_ID_NULL_COUNT": 0,
             "NUMERIC_ID_MIN": 1.0,
             "NUMERIC_ID_MAX": 100.0,
             "NUMERIC_ID_AVG": 50.5,
@@ -174,7 +172,6 @@ class TestSuccessCases:
             "NUMERIC_ID_Q3": 75.0,
             "NUMERIC_ID_DISTINCT": 100,
             "STRING_NAME_COUNT": 100,
-            "STRING_NAME_NULL_COUNT": 0,
             "STRING_NAME_MIN_LENGTH": 3,
             "STRING_NAME_MAX_LENGTH": 20,
             "STRING_NAME_DISTINCT": 95,
@@ -225,7 +222,6 @@ class TestSuccessCases:
         query_result = {
             "TOTAL_ROWS": 10,
             "STRING_NAME_COUNT": 8,
-            "STRING_NAME_NULL_COUNT": 2,
             "STRING_NAME_MIN_LENGTH": 0,
             "STRING_NAME_MAX_LENGTH": 20,
             "STRING_NAME_DISTINCT": 5,
@@ -267,7 +263,6 @@ class TestSuccessCases:
         query_result = {
             "TOTAL_ROWS": 10,
             "STRING_NAME_COUNT": 8,
-            "STRING_NAME_NULL_COUNT": 2,
             "STRING_NAME_MIN_LENGTH": 0,
             "STRING_NAME_MAX_LENGTH": 20,
             "STRING_NAME_DISTINCT": 5,
@@ -1,5 +1,6 @@
 """Tests for data processing module."""
 
+from decimal import Decimal
 from threading import Lock
 
 import pytest
@@ -107,6 +108,73 @@ class TestProcessMultipleRowsData:
         assert len(result.warnings) == 1
         assert "Column 'complex_num' contains unsupported data type" in result.warnings
 
+    def test_process_multiple_rows_data_with_failing_hook(
+        self,
+        converter: JsonImmutableConverter,
+    ) -> None:
+        """Test that a value whose hook raises ValueError is reported as unsupported."""
+        raw_rows = [
+            {"a": Decimal("sNaN"), "b": 1},
+            {"a": Decimal("1.5"), "b": 2},
+        ]
+
+        result = DataProcessingResult.from_raw_rows(converter, raw_rows)
+
+        assert result.processed_rows == [
+            {"a": "<unsupported_type: Decimal>", "b": 1},
+            {"a": 1.5, "b": 2},
+        ]
+        assert result.warnings == ["Column 'a' contains unsupported data type"]
+
+        row_result = RowProcessingResult.from_raw_row(converter, raw_rows[0])
+
+        assert row_result.processed_row == {"a": "<unsupported_type: Decimal>", "b": 1}
+        assert row_result.warnings == ["Column 'a' contains unsupported data type"]
+
+    def test_process_multiple_rows_data_warns_once_per_column(
+        self,
+        converter: JsonImmutableConverter,
+    ) -> None:
+        """Test that each unsupported column is warned about once, in first-seen order."""
+        raw_rows = [
+            {"id": 1, "lock": Lock(), "value": 1},
+            {"id": 2, "lock": Lock(), "value": 2j},
+            {"id": 3, "lock": Lock(), "value": 3j},
+        ]
+
+        result = DataProcessingResult.from_raw_rows(converter, raw_rows)
+
+        assert result.warnings == [
+            "Column 'lock' contains unsupported data type",
+            "Column 'value' contains unsupported data type",
+        ]
+        assert result.processed_rows[0]["value"] == 1
+        assert result.processed_rows[2]["value"] == "<unsupported_type: complex>"
+
+    def test_process_multiple_rows_data_with_mixed_column_types(
+        self,
+        converter: JsonImmutableConverter,
+    ) -> None:
+        """Test that a column whose value type changes between rows is converted per value."""
+        raw_rows = [
+            {"amount": None},
+            {"amount": Decimal("1.5")},
+            {"amount": 2},
+            {"amount": Lock()},
+            {"amount": Decimal("3.25")},
+        ]
+
+        result = DataProcessingResult.from_raw_rows(converter, raw_rows)
+
+        assert [row["amount"] for row in result.processed_rows] == [
+            None,
+            1.5,
+            2,
+            "<unsupported_type: lock>",
+            3.25,
+        ]
+        assert result.warnings == ["Column 'amount' contains unsupported data type"]
+
 
 class TestDataProcessingProperties:
     """Property-based tests for data processing functions."""
@@ -196,6 +196,10 @@ class TestSnowflakeDataType:
         result = SnowflakeDataType.from_raw_str("   ")
         assert result is None
 
+    def test_from_raw_str_interns_instances(self) -> None:
+        """Test from_raw_str returns the same instance for the same raw string."""
+        assert SnowflakeDataType.from_raw_str("NUMBER(38,0)") is SnowflakeDataType.from_raw_str("NUMBER(38,0)")
+
 
 class TestStatisticsSupportDataType:
     """Tests for StatisticsSupportDataType class."""
@@ -270,6 +274,13 @@ class TestStatisticsSupportDataType:
         result = StatisticsSupportDataType.from_snowflake_type(sf_type)
         assert result is None
 
+    def test_from_snowflake_type_interns_instances(self) -> None:
+        """Test conversion returns the same instance for equal SnowflakeDataTypes."""
+        first = StatisticsSupportDataType.from_snowflake_type(SnowflakeDataType("VARCHAR(10)"))
+        second = StatisticsSupportDataType.from_snowflake_type(SnowflakeDataType("VARCHAR(10)"))
+        assert first is not None
+        assert first is second
+
 
 class TestNormalizedSnowflakeDataTypeLiteral:
     """Tests for NormalizedSnowflakeDataType Literal definition."""
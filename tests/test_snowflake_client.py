@@ -254,6 +254,20 @@ class TestSnowflakeClient:
             assert kwargs["authenticator"] == "SNOWFLAKE"
             assert "client_store_temporary_credential" not in kwargs
 
+    def test_get_connection_parameters_are_built_once(self, client: SnowflakeClient) -> None:
+        """Test that connection parameters are cached without the password."""
+        assert client.settings.password is not None
+        with patch("mcp_snowflake.snowflake_client.SnowflakeConnection") as mock_connection:
+            _ = client._get_connection()  # noqa: SLF001
+            conn_params = client._connection_params  # noqa: SLF001
+            _ = client._get_connection()  # noqa: SLF001
+
+            assert client._connection_params is conn_params  # noqa: SLF001
+            assert "password" not in conn_params
+            assert mock_connection.call_count == 2
+            for _, kwargs in mock_connection.call_args_list:
+                assert kwargs["password"] == client.settings.password.get_secret_value()
+
     def test_get_connection_parameters_for_externalbrowser(self, client: SnowflakeClient) -> None:
         """Test externalbrowser auth uses temporary credential cache."""
         externalbrowser_settings = client.settings.model_copy(
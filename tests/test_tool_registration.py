@@ -127,3 +127,37 @@ def test_analyze_table_statistics_timeout_setting_is_applied(
     assert isinstance(tool, AnalyzeTableStatisticsTool)
     effect_handler = cast("AnalyzeTableStatisticsEffectHandler", tool.effect_handler)
     assert effect_handler.query_timeout == timedelta(seconds=180)
+
+
+def test_tool_definitions_match_enabled_tools(
+    mock_thread_pool_executor: ThreadPoolExecutor,
+    mock_snowflake_settings: SnowflakeSettings,
+    base_settings: Settings,
+) -> None:
+    """Test that tool_definitions returns one definition per enabled tool."""
+    base_settings.tools.describe_table = False  # Disabled
+
+    server_context = ServerContext()
+    server_context.prepare(
+        mock_thread_pool_executor,
+        mock_snowflake_settings,
+        base_settings.tools,
+        base_settings.analyze_table_statistics,
+        base_settings.describe_table,
+        base_settings.execute_query,
+        base_settings.list_databases,
+        base_settings.list_schemas,
+        base_settings.list_tables,
+        base_settings.profile_semi_structured_columns,
+        base_settings.sample_table_data,
+        base_settings.search_columns,
+    )
+
+    definitions = server_context.tool_definitions()
+
+    assert [definition.name for definition in definitions] == list(server_context.tool_names())
+    assert definitions == [tool.definition for tool in server_context.tools()]
+
+    # Mutating the returned list must not affect later calls
+    definitions.clear()
+    assert len(server_context.tool_definitions()) == len(list(server_context.tool_names()))
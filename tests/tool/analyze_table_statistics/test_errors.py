@@ -353,7 +353,6 @@ class TestAnalyzeTableStatisticsToolErrors:
                 result_row = {
                     "TOTAL_ROWS": 1000,
                     "STRING_STATUS_COUNT": 1000,
-                    "STRING_STATUS_NULL_COUNT": 0,
                     "STRING_STATUS_MIN_LENGTH": 1,
                     "STRING_STATUS_MAX_LENGTH": 10,
                     "STRING_STATUS_DISTINCT": 3,
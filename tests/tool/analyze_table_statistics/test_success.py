@@ -101,7 +101,6 @@ class TestAnalyzeTableStatisticsToolSuccess:
         statistics_result = {
             "TOTAL_ROWS": 5000,
             "NUMERIC_ID_COUNT": 5000,
-            "NUMERIC_ID_NULL_COUNT": 0,
             "NUMERIC_ID_MIN": 1,
             "NUMERIC_ID_MAX": 5000,
             "NUMERIC_ID_AVG": 2500.5,
@@ -110,19 +109,16 @@ class TestAnalyzeTableStatisticsToolSuccess:
             "NUMERIC_ID_Q3": 3750.75,
             "NUMERIC_ID_DISTINCT": 5000,
             "STRING_NAME_COUNT": 4900,
-            "STRING_NAME_NULL_COUNT": 100,
             "STRING_NAME_MIN_LENGTH": 3,
             "STRING_NAME_MAX_LENGTH": 20,
             "STRING_NAME_DISTINCT": 4500,
             "STRING_NAME_TOP_VALUES": '[["John", 50], ["Jane", 45]]',
             "DATE_CREATED_DATE_COUNT": 4950,
-            "DATE_CREATED_DATE_NULL_COUNT": 50,
             "DATE_CREATED_DATE_MIN": "2023-01-01",
             "DATE_CREATED_DATE_MAX": "2024-12-31",
             "DATE_CREATED_DATE_DISTINCT": 365,
             "DATE_CREATED_DATE_RANGE_DAYS": 730,
             "BOOLEAN_IS_ACTIVE_COUNT": 4950,
-            "BOOLEAN_IS_ACTIVE_NULL_COUNT": 50,
             "BOOLEAN_IS_ACTIVE_TRUE_COUNT": 3000,
             "BOOLEAN_IS_ACTIVE_FALSE_COUNT": 1950,
             "BOOLEAN_IS_ACTIVE_TRUE_PERCENTAGE": 60.61,
@@ -199,7 +195,6 @@ class TestAnalyzeTableStatisticsToolSuccess:
         statistics_result = {
             "TOTAL_ROWS": 500,
             "NUMERIC_ID_COUNT": 500,
-            "NUMERIC_ID_NULL_COUNT": 0,
             "NUMERIC_ID_MIN": 1,
             "NUMERIC_ID_MAX": 500,
             "NUMERIC_ID_AVG": 250.5,
@@ -252,7 +247,6 @@ class TestAnalyzeTableStatisticsToolSuccess:
         statistics_result = {
             "TOTAL_ROWS": 10,
             "STRING_NAME_COUNT": 8,
-            "STRING_NAME_NULL_COUNT": 2,
             "STRING_NAME_MIN_LENGTH": 0,
             "STRING_NAME_MAX_LENGTH": 20,
             "STRING_NAME_DISTINCT": 4,